@@ -1,22 +1,32 @@
-from pydantic_settings import BaseSettings
-from typing import Optional
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Final, Optional
 from pathlib import Path
-from dotenv import load_dotenv
 
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+PROJECT_ROOT: Final[Path] = Path(__file__).resolve().parents[5]
 
 
-load_dotenv(PROJECT_ROOT / ".env")
-
 class AppConfig(BaseSettings):
     
+    model_config = SettingsConfigDict(
+        env_file=str(PROJECT_ROOT / ".env"),
+        env_file_encoding="utf-8",
+        frozen=True,
+        extra="ignore"
+    )
+    
     gemini_api_key: str
     gemini_model: str = "gemini-1.5-flash"
     
     
     mongodb_url: str
     mongodb_db_name: str
+    mongodb_max_pool_size: int = 50
+    mongodb_min_pool_size: int = 10
+    mongodb_server_selection_timeout_ms: int = 3000
+    mongodb_wait_queue_timeout_ms: Optional[int] = None
+    mongodb_compressors: Optional[str] = None
     rabbitmq_url: str 
     
    
@@ -37,9 +47,9 @@ class AppConfig(BaseSettings):
     debug: bool = True
     
     log_level: str = "INFO"
-    
-    class Config:
-        env_file = str(PROJECT_ROOT / ".env")
-        env_file_encoding = "utf-8"
 
-config = AppConfig()
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """Construir la configuración una sola vez, en el primer uso"""
+    return AppConfig()
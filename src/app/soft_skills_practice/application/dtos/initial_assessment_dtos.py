@@ -1,7 +1,16 @@
-from pydantic import BaseModel, validator
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Dict, Any, Literal, Optional
 from datetime import datetime
-from ..utils.validation_utils import ValidationMixins, SanitizationUtils
+from ..utils.validation_utils import ValidationMixins
+
+VALID_OPTION_IDS = frozenset({'A', 'B', 'C', 'D'})
+
+class OptionDTO(BaseModel):
+    """DTO for one multiple choice option of an assessment question"""
+    model_config = ConfigDict(frozen=True)
+    
+    id: Literal['A', 'B', 'C', 'D']
+    text: str
 
 class InitialAssessmentQuestionDTO(BaseModel, ValidationMixins):
     """DTO for initial assessment questions with multiple choice scenarios"""
@@ -10,16 +19,10 @@ class InitialAssessmentQuestionDTO(BaseModel, ValidationMixins):
     skill_name: str
     scenario_text: str
     question_text: str
-    options: List[Dict[str, str]]  # [{"id": "A", "text": "Option text"}, ...]
+    options: tuple[OptionDTO, ...] = Field(min_length=2, max_length=6)
     correct_answer_id: str
     difficulty_level: int
     explanation: str
-    
-    @validator('scenario_text', 'question_text', 'explanation')
-    def validate_text_fields(cls, v):
-        if v:
-            return SanitizationUtils.sanitize_text_input(v)
-        return v
 
 class InitialAssessmentAnswerDTO(BaseModel, ValidationMixins):
     """DTO for user's answer to assessment question"""
@@ -27,9 +30,10 @@ class InitialAssessmentAnswerDTO(BaseModel, ValidationMixins):
     selected_option_id: str
     time_taken_seconds: Optional[int] = None
     
-    @validator('selected_option_id')
-    def validate_option_id(cls, v):
-        if v and v not in ['A', 'B', 'C', 'D']:
+    @field_validator('selected_option_id', mode='after')
+    @classmethod
+    def validate_option_id(cls, v: str) -> str:
+        if v and v not in VALID_OPTION_IDS:
             raise ValueError('Invalid option ID. Must be A, B, C, or D')
         return v
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 
@@ -20,6 +20,27 @@ class PaginationMetaDTO(BaseModel):
     has_previous: bool
 
 
+class VisualConfigDTO(BaseModel):
+    
+    # Inmutable para que Pydantic comparta la instancia por defecto sin copiarla
+    model_config = ConfigDict(frozen=True)
+    
+    icon: str = "🎯"
+    color_hex: str = "#4A90E2"
+    emoji: str = "🎯"
+
+
+class UserProgressDTO(BaseModel):
+    
+    model_config = ConfigDict(frozen=True)
+    
+    progress_percentage: float = 0.0
+    current_level: int = 1
+    points_earned: int = 0
+    sessions_completed: int = 0
+    average_score: float = 0.0
+
+
 class PaginatedSkillDTO(BaseModel):
     
     skill_id: str
@@ -29,19 +50,9 @@ class PaginatedSkillDTO(BaseModel):
     description: str
     category: str
     difficulty: str
-    visual_config: dict = Field(default_factory=lambda: {
-        "icon": "🎯",
-        "color_hex": "#4A90E2",
-        "emoji": "🎯"
-    })
+    visual_config: VisualConfigDTO = VisualConfigDTO()
     estimated_duration_minutes: int = 15
-    user_progress: dict = Field(default_factory=lambda: {
-        "progress_percentage": 0.0,
-        "current_level": 1,
-        "points_earned": 0,
-        "sessions_completed": 0,
-        "average_score": 0.0
-    })
+    user_progress: UserProgressDTO = UserProgressDTO()
     scenarios_count: int = 0
 
 
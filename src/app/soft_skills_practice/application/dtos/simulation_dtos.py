@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, Any, List
 
 from datetime import datetime
@@ -114,20 +114,64 @@ class CompletionFeedbackDTO(BaseModel):
   
 
 
+class ScenarioInfoDTO(BaseModel):
+    """DTO con el resumen del escenario de una sesión"""
+    scenario_id: str
+    title: str
+    description: str
+    skill_type: str
+    difficulty_level: int
+    estimated_duration: int
+    initial_situation: str
+
+
+class ScenarioContextDTO(BaseModel):
+    scenario_title: str
+    skill_type: str
+
+
+class ScenarioMetadataDTO(BaseModel):
+    estimated_duration_minutes: int
+    skill_focus: List[str] = []
+    scenario_context: ScenarioContextDTO
+
+
+class InitialTestDTO(BaseModel):
+    """DTO para el test inicial"""
+    test_id: str
+    question: str
+    context: str
+    expected_skills: List[str]
+    instructions: str
+
+
+class ProgressAnalyticsDTO(BaseModel):
+    """DTO para el resumen de progreso de la sesión"""
+    model_config = ConfigDict(extra="allow")
+    
+    completed_steps: int = 0
+    total_steps: int = 0
+    progress_percentage: float = 0.0
+    average_score: float = 0.0
+    estimated_completion_time: Optional[int] = None
+    time_spent_minutes: Optional[int] = None
+    status_description: Optional[str] = None
+
+
 class StartSimulationResponseDTO(BaseModel):
     """DTO para la respuesta de iniciar simulación - coherente con vistas móviles"""
     session_id: str
     user_id: str
     scenario_id: str
-    scenario: Dict[str, Any]
+    scenario: ScenarioInfoDTO
     initial_situation: str  
-    first_test: Dict[str, Any]  
+    first_test: InitialTestDTO
     session_info: SimulationSessionDTO
     message: str
     
     estimated_duration_minutes: int = 15
     skill_focus: List[str] = []  
-    scenario_metadata: Dict[str, Any] = {}
+    scenario_metadata: Optional[ScenarioMetadataDTO] = None
 
 
 class FirstTestDTO(BaseModel):
@@ -139,15 +183,6 @@ class FirstTestDTO(BaseModel):
     expected_response_time_seconds: int = 120
     
 
-class InitialTestDTO(BaseModel):
-    """DTO para el test inicial"""
-    test_id: str
-    question: str
-    context: str
-    expected_skills: List[str]
-    instructions: str
-
-
 class SimulationCompletedResponseDTO(BaseModel):
     """DTO para respuesta cuando la simulación se completa"""
     session_id: str
@@ -174,10 +209,10 @@ class SimulationStatusDTO(BaseModel):
     is_completed: bool = False
     
     
-    scenario_info: Dict[str, Any] = {}
+    scenario_info: Optional[ScenarioInfoDTO] = None
     
     
     completed_steps: List[Dict[str, Any]] = []
     
     
-    progress_analytics: Dict[str, Any] = {}
+    progress_analytics: Optional[ProgressAnalyticsDTO] = None
@@ -4,7 +4,7 @@ import json
 import logging 
 from dataclasses import dataclass
 
-from ..config.app_config import config
+from ..config.app_config import get_config
 from ...core.exceptions.ai_exceptions import(
     GeminiConnectionException,
     GeminiAPIException,
@@ -25,7 +25,7 @@ class GeminiService:
         
     def _configure_gemini(self):
         try:
-            genai.configure(api_key=config.gemini_api_key)
+            genai.configure(api_key=get_config().gemini_api_key)
             self.model=genai.GenerativeModel('gemini-1.5-flash')
             self.logger.info("Gemini API configured successfully.")
         except Exception as e:
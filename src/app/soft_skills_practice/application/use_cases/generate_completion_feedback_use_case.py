@@ -66,7 +66,7 @@ class GenerateCompletionFeedbackUseCase:
             badge_unlocked = self._check_badge_unlock(performance, skill_assessments)
             print   ("check9")
             
-            return CompletionFeedbackDTO(
+            return CompletionFeedbackDTO.model_construct(
                 session_id=session_id,
                 user_id=session.user_id,
                 scenario_title=scenario.title,
@@ -93,25 +93,25 @@ class GenerateCompletionFeedbackUseCase:
         
         
         scores = [s.evaluation.step_score for s in steps if s.evaluation and s.evaluation.step_score]
-        average_step_score = sum(scores) / len(scores) if scores else 0
-        overall_score = min(100, average_step_score * 1.2)  
+        average_step_score = sum(scores) / len(scores) if scores else 0.0
+        overall_score = min(100.0, average_step_score * 1.2)  
         
         
         total_time = self._calculate_total_time_minutes(session, steps)
         response_times = [s.interaction_tracking.time_to_respond for s in steps 
                          if s.interaction_tracking and s.interaction_tracking.time_to_respond]
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+        avg_response_time = sum(response_times) / len(response_times) if response_times else 0.0
         
         
         help_requests = len([s for s in steps if s.interaction_tracking and s.interaction_tracking.help_requested])
         
         
-        completion_percentage = (len(completed_steps) / session.total_steps) * 100 if session.total_steps > 0 else 0
+        completion_percentage = (len(completed_steps) / session.total_steps) * 100 if session.total_steps > 0 else 0.0
         
         
         confidence_level = self._calculate_confidence_level(steps, avg_response_time)
         
-        return PerformanceMetricsDTO(
+        return PerformanceMetricsDTO.model_construct(
             overall_score=round(overall_score, 1),
             average_step_score=round(average_step_score, 1),
             total_time_minutes=total_time,
@@ -160,7 +160,7 @@ class GenerateCompletionFeedbackUseCase:
                 skill_name, avg_score, unique_strengths, unique_improvements
             )
             
-            skill_assessments.append(SkillAssessmentDTO(
+            skill_assessments.append(SkillAssessmentDTO.model_construct(
                 skill_name=skill_name,
                 score=round(avg_score, 1),
                 level=level,
@@ -52,7 +52,7 @@ class GetSimulationStatusUseCase:
             steps.sort(key=lambda x: x.step_number)
             
            
-            session_info = SimulationSessionDTO(
+            session_info = SimulationSessionDTO.model_construct(
                 session_id=session.session_id,
                 user_id=session.user_id,
                 scenario_id=session.scenario_id,
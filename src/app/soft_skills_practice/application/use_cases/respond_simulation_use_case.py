@@ -104,7 +104,7 @@ class RespondSimulationUseCase:
 
 
                 
-                return SimulationCompletedResponseDTO(
+                return SimulationCompletedResponseDTO.model_construct(
                     session_id=session_id,
                     is_completed=True,
                     completion_feedback=completion_feedback,
@@ -2,7 +2,6 @@ from ..use_cases.start_simulation_use_case import StartSimulationUseCase
 from ..dtos.simulation_dtos import (
     StartSimulationRequestBySoftSkillDTO,
     StartSimulationResponseDTO,
-    SimulationSessionDTO
 
 )
 
@@ -23,49 +22,9 @@ class StartSimulationBySkillUseCase(StartSimulationUseCase):
             session=await self._create_simulation_session(request,scenario)
             initial_test=await self._generate_initial_test(scenario,request)
             initial_step=await self._create_initial_step(session,initial_test)
-            response = StartSimulationResponseDTO(
-                session_id=session.session_id,
-                user_id=session.user_id,
-                scenario_id=str(scenario.id),
-                scenario={
-                    "scenario_id": str(scenario.id),
-                    "title": scenario.title,
-                    "description": scenario.description,
-                    "skill_type": scenario.skill_type,
-                    "difficulty_level": scenario.difficulty_level,
-                    "estimated_duration": scenario.estimated_duration,
-                    "initial_situation": scenario.initial_situation
-                },
-                initial_situation= scenario.initial_situation,
-                first_test={
-                    "test_id": str(initial_step.id),
-                    "question": initial_test["question"],
-                    "context": initial_test["context"],
-                    "instructions": initial_test["instructions"],
-                    "expected_skills": initial_test.get("expected_skills", [scenario.skill_type])
-                },
-                session_info=SimulationSessionDTO(
-                    session_id=session.session_id,
-                    user_id=session.user_id,
-                    scenario_id=str(scenario.id),
-                    skill_type=scenario.skill_type,
-                    status=session.status.value,
-                    current_step=session.current_step,
-                    total_steps=session.total_steps,
-                    started_at=session.session_metadata.started_at,
-                    difficulty_level=session.session_metadata.difficulty_level
-                ),
-                message="Simulation started successfully. Please complete the initial test to continue.",
-                skill_focus=[scenario.skill_type],
-                scenario_metadata={
-                    "estimated_duration_minutes": scenario.estimated_duration,
-                    "skill_focus": [scenario.skill_type],
-                    "scenario_context": {
-                        "scenario_title": scenario.title,
-                        "skill_type": scenario.skill_type
-                    }
-                }
-
+            response = self._build_start_response(
+                session, scenario, initial_test, initial_step,
+                message="Simulation started successfully. Please complete the initial test to continue."
             )
             response=self.response(response)
             
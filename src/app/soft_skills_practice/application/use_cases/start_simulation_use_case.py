@@ -5,7 +5,12 @@ from ..dtos.simulation_dtos import (
     StartSimulationRequestDTO, 
    
     StartSimulationRequestBySoftSkillDTO,
-    
+    StartSimulationResponseDTO,
+    SimulationSessionDTO,
+    ScenarioInfoDTO,
+    ScenarioMetadataDTO,
+    ScenarioContextDTO,
+    InitialTestDTO,
 )
 from ...infrastructure.persistence.repositories.scenario_repository import ScenarioRepository
 from ...infrastructure.persistence.repositories.simulation_session_repository import SimulationSessionRepository
@@ -217,6 +222,57 @@ The question must be open-ended and allow evaluation of the user's previous expe
        
         saved_step = await self.simulation_step_repository.create(step)
         return saved_step
+    def _build_start_response(self, session: SimulationSession, scenario, initial_test: Dict[str, Any], initial_step: SimulationStep, message: str) -> StartSimulationResponseDTO:
+        """Build the start response from already persisted documents.
+
+        Session and scenario values were validated by their Beanie models, so
+        those DTOs use model_construct; only the AI-generated initial test is
+        validated.
+        """
+        return StartSimulationResponseDTO.model_construct(
+            session_id=session.session_id,
+            user_id=session.user_id,
+            scenario_id=str(scenario.id),
+            scenario=ScenarioInfoDTO.model_construct(
+                scenario_id=str(scenario.id),
+                title=scenario.title,
+                description=scenario.description,
+                skill_type=scenario.skill_type,
+                difficulty_level=scenario.difficulty_level,
+                estimated_duration=scenario.estimated_duration,
+                initial_situation=scenario.initial_situation
+            ),
+            initial_situation=scenario.initial_situation,
+            first_test=InitialTestDTO(
+                test_id=str(initial_step.id),
+                question=initial_test["question"],
+                context=initial_test["context"],
+                instructions=initial_test["instructions"],
+                expected_skills=initial_test.get("expected_skills", [scenario.skill_type])
+            ),
+            session_info=SimulationSessionDTO.model_construct(
+                session_id=session.session_id,
+                user_id=session.user_id,
+                scenario_id=str(scenario.id),
+                skill_type=scenario.skill_type,
+                status=session.status.value,
+                current_step=session.current_step,
+                total_steps=session.total_steps,
+                started_at=session.session_metadata.started_at,
+                difficulty_level=session.session_metadata.difficulty_level
+            ),
+            message=message,
+            skill_focus=[scenario.skill_type],
+            scenario_metadata=ScenarioMetadataDTO.model_construct(
+                estimated_duration_minutes=scenario.estimated_duration,
+                skill_focus=[scenario.skill_type],
+                scenario_context=ScenarioContextDTO.model_construct(
+                    scenario_title=scenario.title,
+                    skill_type=scenario.skill_type
+                )
+            )
+        )
+
     def response(self,simulation_response):
          return {
             "success": True,
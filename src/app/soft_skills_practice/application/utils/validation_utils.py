@@ -4,7 +4,7 @@ Validation utilities for input sanitization and data validation
 import re
 import html
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, model_validator
 
 
 class SanitizationUtils:
@@ -136,19 +136,21 @@ class VagueResponseDetector:
 class ValidationMixins:
     """Mixin class to add validation capabilities to Pydantic models"""
     
-    @validator('*', pre=True)
-    def validate_strings(cls, v):
-        """Basic string validation for all string fields"""
-        if isinstance(v, str):
-            return SanitizationUtils.sanitize_text_input(v)
-        return v
+    @model_validator(mode='before')
+    @classmethod
+    def validate_strings(cls, data: Any) -> Any:
+        """Basic string validation for all string fields, in one pass per model"""
+        if isinstance(data, dict):
+            sanitize = SanitizationUtils.sanitize_text_input
+            return {key: sanitize(value) if isinstance(value, str) else value for key, value in data.items()}
+        return data
     
     def validate_required_fields(self) -> Dict[str, Any]:
         """Validate that all required fields are present and valid"""
         errors = {}
         
-        for field_name, field_info in self.__fields__.items():
-            if field_info.required:
+        for field_name, field_info in type(self).model_fields.items():
+            if field_info.is_required():
                 value = getattr(self, field_name, None)
                 if value is None or (isinstance(value, str) and not value.strip()):
                     errors[field_name] = "This field is required"
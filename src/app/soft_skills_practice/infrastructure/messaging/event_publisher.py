@@ -3,11 +3,12 @@ import logging
 from typing import Dict,Any,List,Optional
 from .rabbitmq_producer import RabbitMQProducer
 from datetime import datetime
-from ...application.config.app_config import config
+from ...application.config.app_config import get_config
 
 class EventPublisher:
     def __init__(self,rabbitmq_producer: RabbitMQProducer):
         self.rabbitmq_producer = rabbitmq_producer
+        config = get_config()
         self.notification_queue = config.notifications_queue_name
         self.profile_queue = config.profile_queue_name
     
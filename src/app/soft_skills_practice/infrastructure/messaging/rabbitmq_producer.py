@@ -7,12 +7,12 @@ from datetime import datetime
 import aio_pika
 from aio_pika import Message, DeliveryMode
 from aio_pika.abc import AbstractConnection, AbstractChannel
-from ...application.config.app_config import config
+from ...application.config.app_config import get_config
 logger = logging.getLogger(__name__)
 
 class RabbitMQProducer:
     def __init__(self):
-        self.rabbitmq_url = config.rabbitmq_url
+        self.rabbitmq_url = get_config().rabbitmq_url
         self.connection: Optional[AbstractConnection] = None
         self.channel: Optional[AbstractChannel] = None
         self.is_connected = False
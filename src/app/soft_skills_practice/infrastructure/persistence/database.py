@@ -1,6 +1,6 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
-from ...application.config.app_config import config
+from ...application.config.app_config import get_config
 from .models.simulation_models import (
     SimulationSession, 
     SimulationStep, 
@@ -20,12 +20,28 @@ class DatabaseConnection:
         self.database = None
         self.logger = logging.getLogger(__name__)
     
-    async def connect(self):
-        
+    async def connect(self, **client_overrides):
+        """Conectar a MongoDB; client_overrides reemplaza las opciones del
+        cliente que vienen de la configuración (p. ej. el pool de un script)"""
         try:
-            self.client = AsyncIOMotorClient(config.mongodb_url)
+            config = get_config()
+            client_options = {
+                "maxPoolSize": config.mongodb_max_pool_size,
+                "minPoolSize": config.mongodb_min_pool_size,
+                "serverSelectionTimeoutMS": config.mongodb_server_selection_timeout_ms
+            }
+            if config.mongodb_compressors:
+                client_options["compressors"] = config.mongodb_compressors
+            if config.mongodb_wait_queue_timeout_ms is not None:
+                client_options["waitQueueTimeoutMS"] = config.mongodb_wait_queue_timeout_ms
+            client_options.update(client_overrides)
+            
+            self.client = AsyncIOMotorClient(config.mongodb_url, **client_options)
             self.database = self.client[config.mongodb_db_name]
             
+            # Calentar el pool antes de la primera operación real
+            await self.client.admin.command("ping")
+            
            
             await init_beanie(
                 database=self.database,
@@ -42,6 +42,9 @@ class AssessmentQuestion(Document):
     
     class Settings:
         collection = "assessment_questions"
+        indexes = [
+            "skill_type"
+        ]
 
 class UserAssessmentAnswer(BaseModel):
     """User's answer to an assessment question - Pydantic model"""
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional
 from beanie import PydanticObjectId
 from ..models.assessment_models import AssessmentQuestion, InitialAssessment
@@ -24,17 +25,18 @@ class AssessmentQuestionRepository:
         questions_per_skill: int = 2
     ) -> List[AssessmentQuestion]:
         """Get random questions for each skill type"""
-        all_questions = []
-        
-        for skill_type in skill_types:
-            skill_questions = await self.find_by_skill_type(skill_type)
-            if skill_questions:
-                # Select random questions for this skill
-                selected = random.sample(
-                    skill_questions, 
-                    min(questions_per_skill, len(skill_questions))
-                )
-                all_questions.extend(selected)
+        # Sample on the server so only the selected questions are transferred
+        samples = await asyncio.gather(*(
+            AssessmentQuestion.aggregate(
+                [
+                    {"$match": {"skill_type": skill_type}},
+                    {"$sample": {"size": questions_per_skill}}
+                ],
+                projection_model=AssessmentQuestion
+            ).to_list()
+            for skill_type in skill_types
+        ))
+        all_questions = [question for selected in samples for question in selected]
         
         # Shuffle the final list
         random.shuffle(all_questions)
@@ -47,15 +47,33 @@ class SkillCatalogRepository(BaseRepository[SkillCatalog]):
         
         return categories
     
+    async def get_catalog_summary(self) -> Dict[str, Any]:
+        """Obtener en una sola consulta el total de skills destacadas y el conteo por categoría"""
+        result = await SkillCatalog.aggregate([
+            {"$match": {"is_active": True}},
+            {"$facet": {
+                "featured": [{"$match": {"is_featured": True}}, {"$count": "count"}],
+                "by_category": [
+                    {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+                    {"$sort": {"_id": 1}}
+                ]
+            }}
+        ]).to_list(1)
+        
+        facets = result[0] if result else {"featured": [], "by_category": []}
+        return {
+            "featured_count": facets["featured"][0]["count"] if facets["featured"] else 0,
+            "by_category": {item["_id"]: item["count"] for item in facets["by_category"]}
+        }
+    
     async def update_skill_statistics(self, skill_name: str, stats_update: Dict[str, Any]) -> bool:
         """Actualizar estadísticas de una skill"""
         skill = await self.find_by_skill_name(skill_name)
         if skill:
-            for key, value in stats_update.items():
-                if hasattr(skill, key):
-                    setattr(skill, key, value)
-            
-            await skill.save()
+            # Un único $set con los campos válidos en lugar de setattr + save del documento completo
+            updates = {key: value for key, value in stats_update.items() if key in SkillCatalog.model_fields}
+            if updates:
+                await skill.set(updates)
             return True
         return False
     
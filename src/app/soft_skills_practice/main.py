@@ -0,0 +1,105 @@
+"""Punto de entrada del servicio (console script ``soft-skills-run``)"""
+
+import os
+import sys
+from pathlib import Path
+
+from .application.config.app_config import PROJECT_ROOT
+
+
+ENV_FILE = PROJECT_ROOT / ".env"
+# La app forma parte del paquete, así que se importa igual desde el wheel
+# instalado que desde el checkout
+APP = "app.soft_skills_practice.api:app"
+PACKAGE_DIR = str(Path(__file__).resolve().parent)
+REQUIRED_VARS = frozenset({"GEMINI_API_KEY", "MONGODB_URL", "MONGODB_DB_NAME"})
+
+# python-dotenv solo se importa si hay un .env; en contenedores las variables
+# ya vienen en el entorno
+if ENV_FILE.is_file():
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
+
+RELOAD = os.getenv("RELOAD") == "1"
+
+
+def check_env_vars():
+    """Check that required environment variables are available"""
+    missing_vars = {var for var in REQUIRED_VARS if not os.environ.get(var)}
+    
+    if missing_vars:
+        print(f" Variables faltantes: {', '.join(sorted(missing_vars))}")
+        return False
+    
+    return True
+
+
+def run():
+    """Arrancar el servidor uvicorn"""
+    print(" Archivo .env cargado" if ENV_FILE.is_file() else " Using container environment variables")
+    print(" Iniciando Soft Skills Practice Service")
+    print("=" * 50)
+    
+    if not check_env_vars():
+        print(" Variables de entorno requeridas no encontradas")
+        sys.exit(1)
+    
+    try:
+        import uvicorn
+        
+        print(f" Servidor iniciando en: http://0.0.0.0:8001")
+        print(f" Directorio: {PROJECT_ROOT}")
+        print("=" * 50)
+        
+        if RELOAD:
+            # El supervisor de recarga solo está disponible vía uvicorn.run
+            uvicorn.run(
+                APP,
+                host="0.0.0.0",
+                port=8001,
+                reload=True,
+                reload_dirs=[PACKAGE_DIR],
+                loop="uvloop",
+                http="httptools",
+                log_level="info",
+                access_log=False
+            )
+            return
+        
+        # Un solo proceso salvo que se pida explícitamente: cada worker abre su
+        # propio pool de Motor y su propia conexión a RabbitMQ
+        workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+        if workers > 1:
+            # gunicorn --preload importa la app una vez en el master y los
+            # workers la heredan por fork en lugar de re-importarla cada uno
+            os.execv(sys.executable, [
+                sys.executable, "-m", "gunicorn", APP,
+                "--worker-class", "uvicorn_worker.UvicornWorker",
+                "--workers", str(workers),
+                "--bind", "0.0.0.0:8001",
+                "--preload"
+            ])
+        
+        config = uvicorn.Config(
+            APP,
+            host="0.0.0.0",
+            port=8001,
+            loop="uvloop",
+            http="httptools",
+            log_level="info",
+            access_log=False
+        )
+        server = uvicorn.Server(config)
+        server.run()
+        # Server.run no falla si el arranque (lifespan) no termina; uvicorn.run
+        # sale con STARTUP_FAILURE (3) en ese caso y aquí se hace lo mismo
+        if not server.started:
+            sys.exit(3)
+        
+    except ImportError as e:
+        print(f" Import error: {e}")
+        print(" Install dependencies: pip install -r requirements.txt")
+        sys.exit(1)
+    except Exception as e:
+        print(f" Error starting server: {e}")
+        sys.exit(1)
@@ -0,0 +1,11 @@
+"""Escenarios de ejemplo usados por populate_scenarios.py"""
+
+from pathlib import Path
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Los datos viven en scenarios.json y se parsean una sola vez al importar
+SCENARIOS_DATA = _json.loads((Path(__file__).parent / "scenarios.json").read_bytes())
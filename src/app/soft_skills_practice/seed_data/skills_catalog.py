@@ -0,0 +1,35 @@
+"""Catálogo inicial de soft skills usado por populate_skills_catalog.py"""
+
+from pathlib import Path
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+def _expand(skill, display_order):
+    """Completar los campos derivables de una skill del catálogo"""
+    return {
+        **skill,
+        "gradient_start": skill["primary_color"],
+        "gradient_end": skill["secondary_color"],
+        "icon_url": f"/icons/skills/{skill['skill_name'].replace('_', '-')}.svg",
+        "icon_color": skill.get("icon_color", skill["primary_color"]),
+        "display_order": display_order,
+    }
+
+
+def _load_skills():
+    """Cargar el JSON compacto y numerar display_order dentro de cada categoría"""
+    skills = _json.loads((Path(__file__).parent / "skills_catalog.json").read_bytes())
+    orders = {}
+    expanded = []
+    for skill in skills:
+        orders[skill["category"]] = orders.get(skill["category"], 0) + 1
+        expanded.append(_expand(skill, orders[skill["category"]]))
+    return tuple(expanded)
+
+
+# Se carga una sola vez al importar; la tupla evita modificaciones accidentales
+SKILLS_DATA = _load_skills()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Pruebas de las operaciones bulk_write que generan los scripts de población,
+para una base vacía y para una ya poblada (sin conectarse a MongoDB)
+"""
+import asyncio
+import sys
+import os
+
+from bson import ObjectId, encode
+from bson.raw_bson import RawBSONDocument
+
+# Los scripts populate_*.py viven en la raíz del repositorio
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pymongo import DeleteMany, InsertOne, UpdateOne
+
+from populate_assessment_questions import (
+    QUESTION_CONTENT_FIELDS,
+    build_question_operations,
+    create_assessment_questions,
+)
+from populate_scenarios import build_scenario_operations, seed_scenario_document
+from populate_skills_catalog import build_skill_operations, seed_skill_document
+from app.soft_skills_practice.seed_data.scenarios import SCENARIOS_DATA
+from app.soft_skills_practice.seed_data.skills_catalog import SKILLS_DATA
+
+
+def _seeded(seed_data):
+    """Documentos como los devolvería la proyección sobre una base ya poblada"""
+    return [{"_id": ObjectId(), **data} for data in seed_data]
+
+
+def test_question_operations():
+    """Las preguntas se upsertan por clave natural sin pisar ids ni estadísticas"""
+    print("🔄 Probando operaciones de preguntas de evaluación...")
+    questions = asyncio.run(create_assessment_questions())
+    operations = build_question_operations(questions)
+
+    expected = []
+    for question in questions:
+        document = question.model_dump(exclude={"id", "revision_id"})
+        key = {"skill_type": question.skill_type, "question_text": question.question_text}
+        # En cada ejecución solo se refresca el contenido
+        content = {k: v for k, v in document.items() if k in QUESTION_CONTENT_FIELDS}
+        # El id y las estadísticas de uso solo se escriben al insertar
+        insert_only = {k: v for k, v in document.items() if k not in QUESTION_CONTENT_FIELDS and k not in key}
+        assert {"question_id", "usage_count", "success_rate", "created_at"} <= set(insert_only)
+        expected.append(UpdateOne(
+            key,
+            {"$set": RawBSONDocument(encode(content)), "$setOnInsert": insert_only},
+            upsert=True
+        ))
+    assert operations == expected
+    print(f"✅ {len(operations)} upserts con $set/$setOnInsert separados")
+
+
+def test_scenario_operations_unseeded():
+    """Con la base vacía todos los escenarios se insertan completos"""
+    print("🔄 Probando escenarios sobre una base vacía...")
+    operations, created_titles, updated_titles = build_scenario_operations(SCENARIOS_DATA, {})
+
+    assert len(operations) == len(SCENARIOS_DATA)
+    assert all(isinstance(operation, InsertOne) for operation in operations)
+    assert created_titles == [s["title"] for s in SCENARIOS_DATA]
+    assert updated_titles == []
+    for scenario_data in SCENARIOS_DATA:
+        document = seed_scenario_document(scenario_data)
+        assert "_id" not in document
+        assert {k: document[k] for k in scenario_data} == scenario_data
+        # Deben quedar dentro del índice único parcial de los escenarios semilla
+        assert document["is_create_by_ai"] is False
+        assert document["usage_count"] == 0
+    print(f"✅ {len(operations)} inserciones")
+
+
+def test_scenario_operations_seeded():
+    """En una re-ejecución solo se actualizan los campos que cambiaron"""
+    print("🔄 Probando escenarios sobre una base ya poblada...")
+    existing_docs = _seeded(SCENARIOS_DATA)
+    existing_by_key = {(d["skill_type"], d["title"]): d for d in existing_docs}
+
+    operations, created_titles, updated_titles = build_scenario_operations(SCENARIOS_DATA, existing_by_key)
+    assert operations == [] and created_titles == [] and updated_titles == []
+
+    changed = existing_docs[0]
+    changed["description"] = "Descripción anterior"
+    operations, created_titles, updated_titles = build_scenario_operations(SCENARIOS_DATA, existing_by_key)
+    assert operations == [
+        UpdateOne({"_id": changed["_id"]}, {"$set": {"description": SCENARIOS_DATA[0]["description"]}})
+    ]
+    assert created_titles == [] and updated_titles == [SCENARIOS_DATA[0]["title"]]
+    print("✅ Solo se actualiza el campo modificado, conservando el _id")
+
+
+def test_skill_operations_unseeded():
+    """Con la base vacía todas las skills se insertan y no queda nada que borrar"""
+    print("🔄 Probando catálogo de skills sobre una base vacía...")
+    skill_names = [s["skill_name"] for s in SKILLS_DATA]
+    operations = build_skill_operations(SKILLS_DATA, {})
+
+    assert operations[0] == DeleteMany({"skill_name": {"$nin": skill_names}})
+    inserts = operations[1:]
+    assert len(inserts) == len(SKILLS_DATA)
+    assert all(isinstance(operation, InsertOne) for operation in inserts)
+    for skill_data in SKILLS_DATA:
+        document = seed_skill_document(skill_data)
+        assert "_id" not in document
+        assert {k: document[k] for k in skill_data} == skill_data
+        assert document["total_users_practiced"] == 0
+    print(f"✅ {len(inserts)} inserciones")
+
+
+def test_skill_operations_seeded():
+    """En una re-ejecución se conservan estadísticas y se borran las skills retiradas"""
+    print("🔄 Probando catálogo de skills sobre una base ya poblada...")
+    skill_names = [s["skill_name"] for s in SKILLS_DATA]
+    existing_docs = {d["skill_name"]: d for d in _seeded(SKILLS_DATA)}
+
+    operations = build_skill_operations(SKILLS_DATA, existing_docs)
+    # Solo el borrado: conserva exactamente las skills del catálogo y alcanza
+    # a cualquier skill retirada que siga en la colección
+    assert operations == [DeleteMany({"skill_name": {"$nin": list(existing_docs)}})]
+
+    changed = existing_docs[skill_names[0]]
+    changed["display_order"] = 99
+    operations = build_skill_operations(SKILLS_DATA, existing_docs)
+    assert operations[1:] == [
+        UpdateOne({"_id": changed["_id"]}, {"$set": {"display_order": SKILLS_DATA[0]["display_order"]}})
+    ]
+    print("✅ Solo se actualiza el campo modificado y se borran las skills retiradas")
+
+
+if __name__ == "__main__":
+    try:
+        test_question_operations()
+        test_scenario_operations_unseeded()
+        test_scenario_operations_seeded()
+        test_skill_operations_unseeded()
+        test_skill_operations_seeded()
+        print("\n✅ Operaciones de población verificadas!")
+    except AssertionError as e:
+        print(f"❌ Error en la prueba: {e}")
+        sys.exit(1)